@@ -22,9 +22,51 @@ def get_db():
         db.close()
 
 
+class BatchLoader:
+    # Collects ids for one model and resolves them with a single IN query,
+    # caching rows so repeated ids in the same request are not fetched again.
+    def __init__(self, db: Session, model):
+        self.db = db
+        self.model = model
+        self.cache = {}
+
+    def load_many(self, ids: list[int]) -> list:
+        missing = {i for i in ids if i is not None and i not in self.cache}
+        if missing:
+            rows = self.db.query(self.model).filter(self.model.id.in_(missing)).all()
+            for row in rows:
+                self.cache[row.id] = row
+            for i in missing:
+                self.cache.setdefault(i, None)
+        return [self.cache.get(i) for i in ids]
+
+
+class BookLoaders:
+    def __init__(self, db: Session):
+        self.books = BatchLoader(db, Books)
+        self.authors = BatchLoader(db, Author)
+        self.genres = BatchLoader(db, Genre)
+
+
 db_dependency = Annotated[Session, Depends(get_db)]
 
 
+def get_loaders(db: db_dependency):
+    return BookLoaders(db)
+
+
+loaders_dependency = Annotated[BookLoaders, Depends(get_loaders)]
+
+MAX_BATCH_IDS = 100
+
+
+def validate_batch_ids(ids: list[int]):
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f'At most {MAX_BATCH_IDS} ids per request.')
+    if any(i <= 0 for i in ids):
+        raise HTTPException(status_code=400, detail='Ids must be greater than 0.')
+
+
 @router.get("/", status_code=status.HTTP_200_OK)
 async def read_all_books(db: db_dependency):
     return db.query(Books).all()
@@ -141,6 +183,65 @@ async def read_books_by_genre_and_pages(db: db_dependency,
     raise HTTPException(status_code=404, detail='Books not found.')
 
 
+@router.get("/batch/", status_code=status.HTTP_200_OK)
+async def read_books_by_ids(loaders: loaders_dependency, ids: list[int] = Query(...)):
+    validate_batch_ids(ids)
+
+    book_models = loaders.books.load_many(ids)
+    found = [book for book in book_models if book is not None]
+    if not found:
+        raise HTTPException(status_code=404, detail='Books not found.')
+
+    # One query per relation, no matter how many books are on the page
+    loaders.authors.load_many([book.author_id for book in found])
+    loaders.genres.load_many([book.genre_id for book in found])
+
+    results = []
+    for book in book_models:
+        if book is None:
+            results.append(None)
+            continue
+        author = loaders.authors.cache.get(book.author_id)
+        genre = loaders.genres.cache.get(book.genre_id)
+        results.append({
+            "id": book.id,
+            "title": book.title,
+            "author_id": book.author_id,
+            "author": author.author_name if author else None,
+            "genre_id": book.genre_id,
+            "genre": genre.genre_name if genre else None,
+            "published_date": book.published_date,
+            "page_number": book.page_number,
+            "price": book.price,
+            "rating": book.rating,
+            "synopsis": book.synopsis,
+        })
+
+    return results
+
+
+@router.get("/author/batch/", status_code=status.HTTP_200_OK)
+async def find_authors_by_ids(loaders: loaders_dependency, ids: list[int] = Query(...)):
+    validate_batch_ids(ids)
+
+    author_models = loaders.authors.load_many(ids)
+    if any(author is not None for author in author_models):
+        return author_models
+
+    raise HTTPException(status_code=404, detail='Authors not found.')
+
+
+@router.get("/genre/batch/", status_code=status.HTTP_200_OK)
+async def find_genres_by_ids(loaders: loaders_dependency, ids: list[int] = Query(...)):
+    validate_batch_ids(ids)
+
+    genre_models = loaders.genres.load_many(ids)
+    if any(genre is not None for genre in genre_models):
+        return genre_models
+
+    raise HTTPException(status_code=404, detail='Genres not found.')
+
+
 @router.get("/{book_id}", status_code=status.HTTP_200_OK)
 async def read_book_by_id(db: db_dependency, book_id: int = Path(gt=0)):
 